@@ -72,6 +72,84 @@ SLOTS = [
     {"x": 1860, "y": 2631, "max_w": 1800, "max_h": 400, "rotation": -90}
 ]
 
+# === CALIBRATION OFFSETS ===
+# Adjust these values to align preview with PDF output (shared by print and proof renders)
+# Positive values shift text RIGHT and DOWN
+POSITION_OFFSET_X = -35  # Horizontal offset (correction: move Left)
+POSITION_OFFSET_Y = -10  # Vertical offset (correction: move Up slightly)
+
+# Bump when rendering changes in a way the constants above don't capture,
+# so cached previews and their ETags are invalidated
+RENDER_VERSION = 1
+
+# Values used when an element omits a key
+ELEMENT_DEFAULTS = {"x": 1240, "y": 1754, "max_w": 1800, "max_h": 400, "rotation": 0, "fontSize": 160}
+NAME_FILL = (55, 55, 55, 255)  # Medium dark gray
+
+def resolve_font_path(font_path):
+    """Returns font_path, the Windows Arial fallback, or None (pixel font)."""
+    if os.path.exists(font_path):
+        return font_path
+    windows_fallback = "C:/Windows/Fonts/Arial.ttf"
+    return windows_fallback if os.path.exists(windows_fallback) else None
+
+def element_layout(el):
+    """(x, y, max_w, max_h, rotation, fontSize) of an element, with ELEMENT_DEFAULTS applied."""
+    return (
+        el.get("x", ELEMENT_DEFAULTS["x"]),
+        el.get("y", ELEMENT_DEFAULTS["y"]),
+        el.get("max_w", ELEMENT_DEFAULTS["max_w"]),
+        el.get("max_h", ELEMENT_DEFAULTS["max_h"]),
+        el.get("rotation", ELEMENT_DEFAULTS["rotation"]),
+        int(el.get("fontSize", ELEMENT_DEFAULTS["fontSize"])),
+    )
+
+def _load_font(font_path, size, font_cache):
+    """Font of `size` from a resolved path (None -> pixel font), cached by size in `font_cache`."""
+    if size not in font_cache:
+        try:
+            if font_path:
+                font_cache[size] = ImageFont.truetype(font_path, size)
+            else:
+                font_cache[size] = ImageFont.load_default()
+        except Exception:
+            font_cache[size] = ImageFont.load_default()
+    return font_cache[size]
+
+def draw_text_element(base, text, font, font_size, x, y, max_w, rotation, scale=1.0):
+    """
+    Draws one text element onto `base` exactly like the print render, with all
+    print coordinates multiplied by `scale` (1.0 for print, PROOF_SCALES for proofs).
+    `font` and `font_size` must already be scaled.
+    """
+    # OPTIMIZED: Smart layer sizing (2x padding instead of 2x dimensions)
+    # Calculate actual text size first
+    temp_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    bbox = temp_draw.textbbox((0, 0), text, font=font)
+    text_w = bbox[2] - bbox[0]
+    text_h = bbox[3] - bbox[1]
+
+    # Create layer with 2x padding. Text wider than 2x max_w is cut off on both ends.
+    layer_w = min(text_w * 2, int(max_w * scale * 2))  # Cap at max_w * 2
+    layer_h = min(text_h * 2, font_size * 3)  # Cap at 3x font size
+
+    text_layer = Image.new('RGBA', (layer_w, layer_h), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(text_layer)
+
+    # Center text
+    text_x = (layer_w - text_w) // 2
+    text_y = (layer_h - text_h) // 2
+    draw.text((text_x, text_y), text, font=font, fill=NAME_FILL)
+
+    # Rotate (BILINEAR is faster than BICUBIC)
+    if rotation != 0:
+        text_layer = text_layer.rotate(-rotation, expand=True, resample=Image.BILINEAR)
+
+    # Paste centered at (x, y) + offset - matching frontend translate(-50%, -50%)
+    paste_x = int(x * scale - text_layer.width // 2 + POSITION_OFFSET_X * scale)
+    paste_y = int(y * scale - text_layer.height // 2 + POSITION_OFFSET_Y * scale)
+    base.paste(text_layer, (paste_x, paste_y), text_layer)
+
 def fit_text_to_box(draw, text, font_path, max_width, max_height, max_font_size=160):
     """
     Iteratively reduces font size until text fits within the bounding box.
@@ -125,15 +203,6 @@ def generate_badge(name, template_path, font_path="assets/fonts/OpenSans-Bold.tt
     Returns:
         PIL Image object
     """
-    
-    # === CALIBRATION OFFSETS ===
-    # Adjust these values to align preview with PDF output
-    # Positive values shift text RIGHT and DOWN
-    POSITION_OFFSET_X = -35  # Horizontal offset (correction: move Left)
-    POSITION_OFFSET_Y = -10  # Vertical offset (correction: move Up slightly)
-    # ============================
-
-    # ============================
 
     # 1. Load Template (With Global Caching)
     global _CACHED_TEMPLATE
@@ -157,10 +226,7 @@ def generate_badge(name, template_path, font_path="assets/fonts/OpenSans-Bold.tt
     base = _CACHED_TEMPLATE.copy()
     
     # 2. Font Setup (with caching)
-    current_font_path = font_path
-    if not os.path.exists(current_font_path):
-        windows_fallback = "C:/Windows/Fonts/Arial.ttf"
-        current_font_path = windows_fallback if os.path.exists(windows_fallback) else None
+    current_font_path = resolve_font_path(font_path)
 
     # Font cache for performance
     font_cache = {}
@@ -172,53 +238,12 @@ def generate_badge(name, template_path, font_path="assets/fonts/OpenSans-Bold.tt
             if not text_content or text_content == "Nome Sobrenome":
                 continue
             
-            x = el.get("x", 1240)
-            y = el.get("y", 1754)
-            max_w = el.get("max_w", 1800)
-            max_h = el.get("max_h", 400)
-            rotation = el.get("rotation", 0)
-            user_font_size = int(el.get("fontSize", 160))
+            x, y, max_w, max_h, rotation, user_font_size = element_layout(el)
 
             # Load Font (with caching)
-            if user_font_size not in font_cache:
-                try:
-                    if current_font_path:
-                        font_cache[user_font_size] = ImageFont.truetype(current_font_path, user_font_size)
-                    else:
-                        font_cache[user_font_size] = ImageFont.load_default()
-                except Exception:
-                    font_cache[user_font_size] = ImageFont.load_default()
-            
-            font = font_cache[user_font_size]
+            font = _load_font(current_font_path, user_font_size, font_cache)
 
-            # OPTIMIZED: Smart layer sizing (2x padding instead of 2x dimensions)
-            # Calculate actual text size first
-            temp_img = Image.new('RGBA', (1, 1))
-            temp_draw = ImageDraw.Draw(temp_img)
-            bbox = temp_draw.textbbox((0, 0), text_content, font=font)
-            text_w = bbox[2] - bbox[0]
-            text_h = bbox[3] - bbox[1]
-
-            # Create layer with 2x padding (much smaller than before)
-            layer_w = min(text_w * 2, max_w * 2)  # Cap at max_w * 2
-            layer_h = min(text_h * 2, user_font_size * 3)  # Cap at 3x font size
-            
-            text_layer = Image.new('RGBA', (layer_w, layer_h), (255, 255, 255, 0))
-            draw = ImageDraw.Draw(text_layer)
-
-            # Center text
-            text_x = (layer_w - text_w) // 2
-            text_y = (layer_h - text_h) // 2
-            draw.text((text_x, text_y), text_content, font=font, fill=(55, 55, 55, 255))  # Medium dark gray
-
-            # Rotate (BILINEAR is faster than BICUBIC)
-            if rotation != 0:
-               text_layer = text_layer.rotate(-rotation, expand=True, resample=Image.BILINEAR)
-            
-            # Paste centered at (x, y) + offset - matching frontend translate(-50%, -50%)
-            paste_x = int(x - text_layer.width // 2 + POSITION_OFFSET_X)
-            paste_y = int(y - text_layer.height // 2 + POSITION_OFFSET_Y)
-            base.paste(text_layer, (paste_x, paste_y), text_layer)
+            draw_text_element(base, text_content, font, user_font_size, x, y, max_w, rotation)
 
     else:
         # Legacy SLOTS fallback
@@ -243,7 +268,7 @@ def generate_badge(name, template_path, font_path="assets/fonts/OpenSans-Bold.tt
 
             text_x = (layer_w - text_w) // 2
             text_y = (layer_h - text_h) // 2
-            draw.text((text_x, text_y), name, font=font, fill=(55, 55, 55, 255))  # Medium dark gray
+            draw.text((text_x, text_y), name, font=font, fill=NAME_FILL)
 
             if rotation != 0:
                 text_layer = text_layer.rotate(-rotation, expand=True, resample=Image.BILINEAR)
@@ -253,3 +278,142 @@ def generate_badge(name, template_path, font_path="assets/fonts/OpenSans-Bold.tt
             base.paste(text_layer, (paste_x, paste_y), text_layer)
 
     return base
+
+# --- PROOF SHEETS ---
+# Low-resolution contact sheets for pre-print review: every badge is rendered
+# at thumbnail scale against a downscaled template and tiled into a few pages.
+PROOF_SCALE = 0.1
+# Only these scales are accepted: they bound page size (0.15 -> 2976x2750 RGB,
+# ~25 MB per page) and the number of resized templates kept in memory.
+PROOF_SCALES = (0.05, 0.1, 0.15)
+PROOF_COLUMNS = 8
+PROOF_ROWS = 5
+PROOF_CAPTION_H = 24
+OVERFLOW_COLOR = (220, 38, 38, 255)
+
+_PROOF_TEMPLATES = {}  # one entry per PROOF_SCALES size at most
+
+def _load_proof_template(template_path, size):
+    """Template resized to thumbnail size, cached per size."""
+    if size not in _PROOF_TEMPLATES:
+        try:
+            if os.path.exists(template_path):
+                img = Image.open(template_path).convert("RGBA")
+                _PROOF_TEMPLATES[size] = img.resize(size, Image.BILINEAR)
+            else:
+                _PROOF_TEMPLATES[size] = Image.new('RGBA', size, (255, 255, 255, 255))
+        except Exception as e:
+            print(f"[ERROR] Failed to load template for proof: {e}")
+            _PROOF_TEMPLATES[size] = Image.new('RGBA', size, (255, 255, 255, 255))
+    return _PROOF_TEMPLATES[size]
+
+def generate_badge_thumbnail(template_path, font_path, elements, scale=PROOF_SCALE, font_cache=None):
+    """
+    Render a badge at thumbnail scale and check every element against its box.
+
+    Text is drawn with draw_text_element, the same routine generate_badge uses, at
+    a scaled font size, so names cut off in print are cut off here too. The
+    overflow check measures at full print resolution.
+
+    Returns:
+        (PIL Image, list of overflow dicts: element, content, text_w, text_h, max_w, max_h, fontSize)
+    """
+    if scale not in PROOF_SCALES:
+        raise ValueError(f"scale must be one of {PROOF_SCALES}")
+
+    size = (max(1, int(A4_WIDTH * scale)), max(1, int(A4_HEIGHT * scale)))
+    base = _load_proof_template(template_path, size).copy()
+
+    current_font_path = resolve_font_path(font_path)
+
+    if font_cache is None:
+        font_cache = {}
+    measure_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    overflows = []
+
+    for el_index, el in enumerate(elements or []):
+        text_content = el.get("content")
+        if not text_content or text_content == "Nome Sobrenome":
+            continue
+
+        x, y, max_w, max_h, rotation, user_font_size = element_layout(el)
+
+        # Overflow check at print resolution
+        font = _load_font(current_font_path, user_font_size, font_cache)
+        bbox = measure_draw.textbbox((0, 0), text_content, font=font)
+        text_w = bbox[2] - bbox[0]
+        text_h = bbox[3] - bbox[1]
+        if text_w > max_w or text_h > max_h:
+            overflows.append({
+                "element": el_index,
+                "content": text_content,
+                "text_w": text_w,
+                "text_h": text_h,
+                "max_w": max_w,
+                "max_h": max_h,
+                "fontSize": user_font_size,
+            })
+
+        # Thumbnail render
+        thumb_font_size = max(1, int(user_font_size * scale))
+        thumb_font = _load_font(current_font_path, thumb_font_size, font_cache)
+        draw_text_element(base, text_content, thumb_font, thumb_font_size, x, y, max_w, rotation, scale)
+
+    return base, overflows
+
+def generate_proof_sheets(badges, template_path, font_path, scale=PROOF_SCALE,
+                          columns=PROOF_COLUMNS, rows=PROOF_ROWS):
+    """
+    Tile thumbnails of every badge into contact-sheet pages.
+
+    Pages are yielded one at a time so the caller can encode and release each
+    before the next one is built.
+
+    Args:
+        badges: List of (label, elements) tuples, one per printed badge
+        scale: Thumbnail scale relative to the 300 DPI A4 page, one of PROOF_SCALES
+
+    Yields:
+        (PIL Image, list of (badge index, overflow dicts) for badges with overflows) per page
+    """
+    if scale not in PROOF_SCALES:
+        raise ValueError(f"scale must be one of {PROOF_SCALES}")
+
+    thumb_w = max(1, int(A4_WIDTH * scale))
+    thumb_h = max(1, int(A4_HEIGHT * scale))
+    cell_w = thumb_w
+    cell_h = thumb_h + PROOF_CAPTION_H
+    per_page = max(1, columns * rows)
+
+    font_cache = {}
+    caption_font = _load_font(resolve_font_path(font_path), 14, font_cache)
+
+    for start in range(0, len(badges), per_page):
+        chunk = badges[start:start + per_page]
+        page_rows = (len(chunk) + columns - 1) // columns
+        page = Image.new('RGB', (cell_w * min(columns, len(chunk)), cell_h * page_rows), (255, 255, 255))
+        draw = ImageDraw.Draw(page)
+        page_overflows = []
+
+        for offset, (label, elements) in enumerate(chunk):
+            badge_index = start + offset
+            thumb, overflows = generate_badge_thumbnail(template_path, font_path, elements, scale, font_cache)
+            cell_x = (offset % columns) * cell_w
+            cell_y = (offset // columns) * cell_h
+            page.paste(thumb, (cell_x, cell_y), thumb)
+
+            caption_color = (0, 0, 0)
+            if overflows:
+                caption_color = OVERFLOW_COLOR[:3]
+                draw.rectangle(
+                    [cell_x, cell_y, cell_x + thumb_w - 1, cell_y + thumb_h - 1],
+                    outline=caption_color, width=3,
+                )
+                page_overflows.append((badge_index, overflows))
+
+            caption = f"#{badge_index + 1} {label}"
+            while len(caption) > 1 and draw.textlength(caption, font=caption_font) > cell_w - 8:
+                caption = caption[:-2] + "…"
+            draw.text((cell_x + 4, cell_y + thumb_h + 4), caption, font=caption_font, fill=caption_color)
+
+        yield page, page_overflows
@@ -0,0 +1,337 @@
+"""
+Concurrent load-testing harness for the badge backend.
+
+Starts a local uvicorn instance (from this 'backend/' directory), mixes
+editor preview-drag traffic with concurrent batch exports, and sweeps
+client concurrency and uvicorn worker counts. For each point it reports
+throughput, tail latency, server RSS and CPU so saturation curves can be
+compared between runs.
+
+Usage (from 'backend/'):
+    python load_test.py
+    python load_test.py --workers 1,2,4 --concurrency 1,4,8,16,32 --duration 30
+    python load_test.py --url http://localhost:8000 --concurrency 1,8   # existing server
+    python load_test.py --duplicate-ratio 0.5   # resend identical previews (re-renders, tabs)
+    python load_test.py --output results.json
+
+Install the extra dependencies with:
+    pip install -r requirements-loadtest.txt
+
+RSS/CPU sampling needs 'psutil' (listed there); without it those columns
+are left empty.
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Same layout the editor starts with (frontend/src/context/EditorContext.jsx), with
+# fontSize mapped from max_font_size the way App.jsx does before sending
+DEFAULT_ELEMENTS = [
+    {"type": "text", "content": "Nome Sobrenome", "x": 944, "y": 887, "rotation": 90, "max_w": 1800, "max_h": 400, "max_font_size": 120, "fontSize": 120},
+    {"type": "text", "content": "Nome Sobrenome", "x": 944, "y": 2605, "rotation": 90, "max_w": 1800, "max_h": 400, "max_font_size": 120, "fontSize": 120},
+    {"type": "text", "content": "Nome Sobrenome", "x": 1613, "y": 969, "rotation": -90, "max_w": 1800, "max_h": 400, "max_font_size": 120, "fontSize": 120},
+    {"type": "text", "content": "Nome Sobrenome", "x": 1613, "y": 2681, "rotation": -90, "max_w": 1800, "max_h": 400, "max_font_size": 120, "fontSize": 120},
+]
+
+SAMPLE_NAMES = [
+    "Ana Souza", "Bruno Oliveira", "Carla Mendes", "Daniel Ferreira",
+    "Eduarda Lima", "Fernando Alves", "Gabriela Rocha", "Henrique Costa",
+    "Isabela Martins", "João Pedro Carvalho", "Larissa Gomes", "Marcelo Ribeiro",
+]
+
+
+# --- TRAFFIC ---
+def preview_payload(rng, last_payload=None, duplicate_ratio=0.0):
+    """
+    Simulates one frame of an editor drag: same name, element nudged a few px.
+    With probability `duplicate_ratio` the previous payload is resent unchanged,
+    like a re-render or a second tab on the same layout.
+    """
+    if last_payload is not None and rng.random() < duplicate_ratio:
+        return last_payload
+    name = rng.choice(SAMPLE_NAMES)
+    elements = []
+    for el in DEFAULT_ELEMENTS:
+        modified_el = el.copy()
+        modified_el["content"] = name
+        modified_el["x"] += rng.randint(-15, 15)
+        modified_el["y"] += rng.randint(-15, 15)
+        elements.append(modified_el)
+    return {"name": name, "elements": elements}
+
+
+def batch_payload(rng, batch_size):
+    names = [rng.choice(SAMPLE_NAMES) for _ in range(batch_size)]
+    return {"names": names, "elements": [el.copy() for el in DEFAULT_ELEMENTS]}
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class ResourceSampler(threading.Thread):
+    """Polls RSS and CPU of the server process tree (uvicorn master + workers + batch pools)."""
+
+    def __init__(self, pid, interval=0.25):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.rss_samples = []
+        self.cpu_samples = []
+        self._stop_event = threading.Event()
+
+    def _tree(self):
+        root = psutil.Process(self.pid)
+        return [root] + root.children(recursive=True)
+
+    def run(self):
+        if psutil is None or self.pid is None:
+            return
+        seen = {}
+        while not self._stop_event.is_set():
+            rss = 0
+            cpu = 0.0
+            try:
+                for proc in self._tree():
+                    try:
+                        # Reuse Process objects so cpu_percent() measures since the last poll
+                        proc = seen.setdefault(proc.pid, proc)
+                        rss += proc.memory_info().rss
+                        cpu += proc.cpu_percent(None)
+                    except psutil.Error:
+                        continue
+            except psutil.Error:
+                break
+            self.rss_samples.append(rss)
+            self.cpu_samples.append(cpu)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def run_point(base_url, concurrency, duration, batch_ratio, batch_size, duplicate_ratio, server_pid, seed):
+    """
+    Runs `concurrency` closed-loop clients for `duration` seconds and returns the measurements.
+
+    Rates, latencies and RSS/CPU cover only the fixed window: requests still in
+    flight at the deadline (e.g. a batch export started just before it) are
+    counted as `late` and the time spent waiting for them is reported as `overrun_s`.
+    """
+    results = {"preview": [], "batch": []}
+    errors = {"preview": 0, "batch": 0}
+    late = {"preview": 0, "batch": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(client_id):
+        rng = random.Random(seed + client_id)
+        session = requests.Session()
+        last_preview = None
+        while time.perf_counter() < deadline:
+            if rng.random() < batch_ratio:
+                kind, path, payload, timeout = "batch", "/api/generate-batch", batch_payload(rng, batch_size), 300
+            else:
+                last_preview = preview_payload(rng, last_preview, duplicate_ratio)
+                kind, path, payload, timeout = "preview", "/api/preview", last_preview, 60
+            start = time.perf_counter()
+            try:
+                res = session.post(base_url + path, json=payload, timeout=timeout)
+                ok = res.status_code == 200
+            except requests.RequestException:
+                ok = False
+            finished = time.perf_counter()
+            elapsed = finished - start
+            with lock:
+                if finished > deadline:
+                    late[kind] += 1
+                elif ok:
+                    results[kind].append(elapsed)
+                else:
+                    errors[kind] += 1
+
+    sampler = ResourceSampler(server_pid)
+    sampler.start()
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    time.sleep(max(0.0, deadline - time.perf_counter()))
+    sampler.stop()
+    for t in threads:
+        t.join()
+    overrun = time.perf_counter() - deadline
+
+    point = {
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "overrun_s": round(overrun, 3),
+        "peak_rss_mb": round(max(sampler.rss_samples) / 1024 / 1024, 1) if sampler.rss_samples else None,
+        "mean_cpu_pct": round(sum(sampler.cpu_samples) / len(sampler.cpu_samples), 1) if sampler.cpu_samples else None,
+        "peak_cpu_pct": round(max(sampler.cpu_samples), 1) if sampler.cpu_samples else None,
+    }
+    for kind, latencies in results.items():
+        point[kind] = {
+            "requests": len(latencies),
+            "errors": errors[kind],
+            "late": late[kind],
+            "throughput_rps": round(len(latencies) / duration, 2) if duration else 0.0,
+            "p50_ms": _ms(percentile(latencies, 50)),
+            "p95_ms": _ms(percentile(latencies, 95)),
+            "p99_ms": _ms(percentile(latencies, 99)),
+            "max_ms": _ms(max(latencies) if latencies else None),
+        }
+    return point
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+# --- SERVER ---
+def port_is_free(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(("127.0.0.1", port))
+        except OSError:
+            return False
+    return True
+
+
+def start_server(port, workers):
+    if not port_is_free(port):
+        raise RuntimeError(f"port {port} is already in use; pick another with --port")
+    cmd = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR)
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(120):
+        if proc.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+        try:
+            healthy = requests.get(base_url + "/api/health", timeout=1).status_code == 200
+        except requests.RequestException:
+            healthy = False
+        if healthy:
+            # Make sure the answer came from our uvicorn and not something else on the port
+            time.sleep(0.5)
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+            return proc, base_url
+        time.sleep(0.5)
+    stop_server(proc)
+    raise RuntimeError("uvicorn did not become healthy within 60s")
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def warm_up(base_url):
+    """One preview + one small batch so template/font caches and pools are primed."""
+    rng = random.Random(0)
+    for path, payload, timeout in (
+        ("/api/preview", preview_payload(rng), 60),
+        ("/api/generate-batch", batch_payload(rng, 2), 120),
+    ):
+        res = requests.post(base_url + path, json=payload, timeout=timeout)
+        if res.status_code != 200:
+            raise RuntimeError(f"warm-up {path} returned {res.status_code}: {res.text[:200]}")
+
+
+# --- REPORT ---
+def print_point(workers, point):
+    def fmt(value):
+        return "-" if value is None else str(value)
+
+    for kind in ("preview", "batch"):
+        stats = point[kind]
+        print(
+            f"{fmt(workers):>7} {point['concurrency']:>5} {kind:>8} "
+            f"{stats['throughput_rps']:>8} {fmt(stats['p50_ms']):>9} {fmt(stats['p95_ms']):>9} "
+            f"{fmt(stats['p99_ms']):>9} {stats['errors']:>6} {stats['late']:>5} "
+            f"{fmt(point['peak_rss_mb']):>9} {fmt(point['mean_cpu_pct']):>8} {point['overrun_s']:>9}"
+        )
+
+
+def parse_int_list(value):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test /api/preview and /api/generate-batch")
+    parser.add_argument("--workers", type=parse_int_list, default=[1, 2], help="uvicorn worker counts to sweep (comma separated)")
+    parser.add_argument("--concurrency", type=parse_int_list, default=[1, 2, 4, 8, 16], help="client concurrency levels (comma separated)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per point")
+    parser.add_argument("--batch-ratio", type=float, default=0.05, help="fraction of requests that are batch exports")
+    parser.add_argument("--batch-size", type=int, default=20, help="names per batch export")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0, help="fraction of previews that resend the previous payload unchanged")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="target an already running server instead of starting uvicorn (skips worker sweep)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write all points as JSON for plotting saturation curves")
+    args = parser.parse_args()
+
+    if psutil is None:
+        print("[WARNING] psutil not installed (pip install -r requirements-loadtest.txt); RSS/CPU columns will be empty.")
+    elif args.url:
+        print("[WARNING] --url targets an external server whose process is unknown; RSS/CPU columns will be empty.")
+
+    print(f"{'workers':>7} {'conc':>5} {'kind':>8} {'rps':>8} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9} {'errors':>6} {'late':>5} {'rss_mb':>9} {'cpu_%':>8} {'overrun_s':>9}")
+
+    report = []
+    worker_counts = [None] if args.url else args.workers
+    for workers in worker_counts:
+        proc = None
+        if args.url:
+            base_url, server_pid = args.url.rstrip("/"), None
+        else:
+            proc, base_url = start_server(args.port, workers)
+            server_pid = proc.pid
+        try:
+            warm_up(base_url)
+            for concurrency in args.concurrency:
+                point = run_point(base_url, concurrency, args.duration, args.batch_ratio,
+                                  args.batch_size, args.duplicate_ratio, server_pid, args.seed)
+                point["workers"] = workers
+                report.append(point)
+                print_point(workers, point)
+        finally:
+            if proc is not None:
+                stop_server(proc)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "points": report}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
 import base64
+import concurrent.futures
+import hashlib
 import io
+import json
 import os
+import threading
+import time
 import zipfile
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from badge_engine import generate_badge, A4_WIDTH, A4_HEIGHT, DPI
+from badge_engine import generate_badge, generate_proof_sheets, A4_WIDTH, A4_HEIGHT, DPI, PROOF_SCALE, PROOF_SCALES
+from badge_engine import RENDER_VERSION, POSITION_OFFSET_X, POSITION_OFFSET_Y, NAME_FILL, ELEMENT_DEFAULTS
 
 app = FastAPI()
 
@@ -39,6 +46,11 @@ class BatchRequest(BaseModel):
     names: List[str]
     elements: List[Dict[str, Any]]
 
+class ProofRequest(BaseModel):
+    names: List[str]
+    elements: List[Dict[str, Any]]
+    scale: Optional[float] = PROOF_SCALE
+
 # --- PATHS ---
 # Assuming running from 'backend/' directory
 TEMPLATE_PATH = "assets/templates/template.png"
@@ -50,30 +62,218 @@ def ensure_assets():
     if not os.path.exists(FONT_PATH):
         print(f"WARNING: Font not found at {os.path.abspath(FONT_PATH)}")
 
+_asset_fingerprint = None
+
+def asset_fingerprint():
+    """
+    Identifies what a preview is rendered from besides the payload: template and
+    font files (size + mtime) and the renderer settings. Computed once per process.
+    """
+    global _asset_fingerprint
+    if _asset_fingerprint is None:
+        files = {}
+        for path in (TEMPLATE_PATH, FONT_PATH):
+            try:
+                st = os.stat(path)
+                files[path] = [st.st_size, st.st_mtime_ns]
+            except OSError:
+                files[path] = None
+        renderer = {
+            "version": RENDER_VERSION,
+            "offset": [POSITION_OFFSET_X, POSITION_OFFSET_Y],
+            "fill": list(NAME_FILL),
+            "defaults": ELEMENT_DEFAULTS,
+        }
+        payload = json.dumps({"files": files, "renderer": renderer}, sort_keys=True)
+        _asset_fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return _asset_fingerprint
+
 @app.on_event("startup")
 async def startup_event():
     ensure_assets()
+    asset_fingerprint()
 
 # --- ENDPOINTS ---
 @app.get("/api/health")
 def health_check():
     return {"status": "ok", "backend": "FastAPI"}
 
+# --- PREVIEW CACHE ---
+# Identical preview payloads (re-renders, multiple tabs, several users on the
+# same layout) are coalesced onto a single render and kept for a short TTL.
+PREVIEW_CACHE_TTL = 30  # seconds
+PREVIEW_CACHE_MAX_BYTES = 16 * 1024 * 1024  # per worker; a full A4 preview is roughly 0.4 MB of base64
+
+# Insertion ordered: with a fixed TTL the oldest entry is always the first to expire
+_preview_cache = OrderedDict()  # key -> (expires_at, image_base64)
+_preview_cache_bytes = 0
+_preview_inflight = {}          # key -> Future of image_base64
+_preview_lock = threading.Lock()
+
+def _evict_preview_cache(now):
+    """Drop expired entries, then the oldest ones until under the byte bound. Caller holds _preview_lock."""
+    global _preview_cache_bytes
+    while _preview_cache:
+        key, (expires_at, img_str) = next(iter(_preview_cache.items()))
+        if expires_at > now and _preview_cache_bytes <= PREVIEW_CACHE_MAX_BYTES:
+            break
+        del _preview_cache[key]
+        _preview_cache_bytes -= len(img_str)
+
+def _store_preview(key, img_str):
+    """Caller holds _preview_lock."""
+    global _preview_cache_bytes
+    now = time.monotonic()
+    old = _preview_cache.pop(key, None)
+    if old:
+        _preview_cache_bytes -= len(old[1])
+    _preview_cache[key] = (now + PREVIEW_CACHE_TTL, img_str)
+    _preview_cache_bytes += len(img_str)
+    _evict_preview_cache(now)
+
+def preview_cache_key(name, elements):
+    """Canonical hash of a preview payload (key order and whitespace independent) and the assets it renders with."""
+    payload = json.dumps(
+        {"name": name, "elements": elements, "assets": asset_fingerprint()},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def etag_matches(if_none_match, etag):
+    """
+    If-None-Match uses weak comparison: ignore W/ prefixes. '*' is not honoured,
+    since for a POST it would have to mean 412 rather than 304 (RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def render_preview(name, elements):
+    img = generate_badge(name, TEMPLATE_PATH, FONT_PATH, elements)
+
+    # Convert to Base64
+    buffered = io.BytesIO()
+    img.save(buffered, format="PNG")
+    return base64.b64encode(buffered.getvalue()).decode("utf-8")
+
+def get_preview_single_flight(key, name, elements):
+    """
+    Returns the base64 preview for `key`, rendering at most once per key:
+    served from the TTL cache, joined onto an in-flight render, or rendered here.
+    """
+    with _preview_lock:
+        now = time.monotonic()
+        cached = _preview_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        if cached:
+            _evict_preview_cache(now)
+        future = _preview_inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = concurrent.futures.Future()
+            _preview_inflight[key] = future
+
+    if not is_leader:
+        # Raises the leader's exception if its render failed
+        return future.result()
+
+    img_str = None
+    try:
+        img_str = render_preview(name, elements)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    except BaseException:
+        # Cancellation/interpreter exit belongs to the leader only; followers get
+        # an ordinary error so their requests end in a 500
+        future.set_exception(RuntimeError("preview render aborted"))
+        raise
+    finally:
+        # Always resolve and pop the future so followers never block on an orphaned render
+        with _preview_lock:
+            _preview_inflight.pop(key, None)
+            if img_str is not None:
+                _store_preview(key, img_str)
+        if not future.done():
+            future.set_result(img_str)
+    return img_str
+
 @app.post("/api/preview")
-def generate_preview(req: PreviewRequest):
+def generate_preview(req: PreviewRequest, if_none_match: Optional[str] = Header(None)):
+    key = preview_cache_key(req.name, req.elements)
+    etag = f'"{key}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    # The ETag is derived from the payload, so a match needs no render at all
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
     try:
-        # req.elements is already a list of dicts
-        img = generate_badge(req.name, TEMPLATE_PATH, FONT_PATH, req.elements)
-        
-        # Convert to Base64
-        buffered = io.BytesIO()
-        img.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
-        
-        return {"image_base64": img_str}
+        img_str = get_preview_single_flight(key, req.name, req.elements)
+        return JSONResponse(content={"image_base64": img_str}, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def group_in_pairs(names):
+    """Two names per printed A4 page (top and bottom badge)."""
+    return [names[i:i+2] for i in range(0, len(names), 2)]
+
+def pair_slot(el_index):
+    """0 for the top name (elements 0/2), 1 for the bottom name (1/3), None for fixed layout elements."""
+    if el_index in [0, 2]:  # Top
+        return 0
+    if el_index in [1, 3]:  # Bottom
+        return 1
+    return None
+
+def elements_for_pair(pair, elements_template):
+    """Copy the layout and fill elements 0/2 with the top name and 1/3 with the bottom one."""
+    elements_for_pdf = []
+    for el_index, el in enumerate(elements_template):
+        modified_el = el.copy()
+        slot = pair_slot(el_index)
+        if slot is not None:
+            modified_el['content'] = pair[slot].strip() if len(pair) > slot else 'Nome Sobrenome'
+        elements_for_pdf.append(modified_el)
+    return elements_for_pdf
+
+def build_proof_report(names, badge_overflows):
+    """
+    Groups per-element overflows by name: one entry per name that doesn't fit,
+    listing the boxes it overflows. Fixed layout elements (index 4+) are the same
+    on every badge, so each is reported once under 'layout_overflows'.
+    """
+    overflows = []
+    layout_overflows = {}
+    for badge_index, element_overflows in badge_overflows:
+        by_slot = {}
+        for overflow in element_overflows:
+            slot = pair_slot(overflow["element"])
+            if slot is None:
+                layout_overflows.setdefault(overflow["element"], overflow)
+                continue
+            if slot not in by_slot:
+                index = badge_index * 2 + slot
+                by_slot[slot] = {"badge": badge_index, "index": index, "name": names[index].strip(), "elements": []}
+            box = {k: v for k, v in overflow.items() if k != "content"}
+            by_slot[slot]["elements"].append(box)
+        overflows.extend(by_slot[slot] for slot in sorted(by_slot))
+
+    return {
+        "total_names": len(names),
+        "total_badges": (len(names) + 1) // 2,
+        "overflow_count": len(overflows),
+        "overflows": overflows,
+        "layout_overflows": [layout_overflows[k] for k in sorted(layout_overflows)],
+    }
+
 # Helper function for parallel processing (must be at top level)
 def process_single_pair_pdf(args):
     """
@@ -85,14 +285,7 @@ def process_single_pair_pdf(args):
     
     try:
         # Create element list for this PDF
-        elements_for_pdf = []
-        for el_index, el in enumerate(elements_template):
-            modified_el = el.copy()
-            if el_index in [0, 2]:  # Top
-                modified_el['content'] = pair[0].strip() if len(pair) > 0 else 'Nome Sobrenome'
-            elif el_index in [1, 3]:  # Bottom
-                modified_el['content'] = pair[1].strip() if len(pair) > 1 else 'Nome Sobrenome'
-            elements_for_pdf.append(modified_el)
+        elements_for_pdf = elements_for_pair(pair, elements_template)
         
         # Generate Badge
         img = generate_badge("Badge", template_path, font_path, elements_for_pdf)
@@ -115,9 +308,7 @@ def generate_batch(req: BatchRequest):
         raise HTTPException(status_code=400, detail="List of names is empty")
 
     # Group names in pairs
-    name_pairs = []
-    for i in range(0, len(req.names), 2):
-        name_pairs.append(req.names[i:i+2])
+    name_pairs = group_in_pairs(req.names)
     
     zip_buffer = io.BytesIO()
     errors = []
@@ -132,8 +323,6 @@ def generate_batch(req: BatchRequest):
         for pair in name_pairs
     ]
 
-    import concurrent.futures
-
     # Store results in memory to check count before zipping
     batch_results = []
     
@@ -174,3 +363,33 @@ def generate_batch(req: BatchRequest):
             media_type="application/zip",
             headers={"Content-Disposition": "attachment; filename=crachas_finalizados.zip"}
         )
+
+@app.post("/api/proof-sheet")
+def generate_proof_sheet(req: ProofRequest):
+    """
+    Low-resolution contact sheets of every badge for pre-print review, plus a
+    report of names that overflow their max_w/max_h box at print size.
+    """
+    if not req.names:
+        raise HTTPException(status_code=400, detail="List of names is empty")
+    if req.scale not in PROOF_SCALES:
+        raise HTTPException(status_code=400, detail=f"scale must be one of {list(PROOF_SCALES)}")
+
+    try:
+        badges = [
+            (" / ".join(n.strip() for n in pair), elements_for_pair(pair, req.elements))
+            for pair in group_in_pairs(req.names)
+        ]
+        # Encode each page as soon as it is built so only one full page is in memory
+        pages_base64 = []
+        badge_overflows = []
+        for page, page_overflows in generate_proof_sheets(badges, TEMPLATE_PATH, FONT_PATH, scale=req.scale):
+            buffered = io.BytesIO()
+            page.save(buffered, format="PNG")
+            page.close()
+            pages_base64.append(base64.b64encode(buffered.getvalue()).decode("utf-8"))
+            badge_overflows.extend(page_overflows)
+
+        return {"pages": pages_base64, "report": build_proof_report(req.names, badge_overflows)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The backend is run from 'backend/' and imports its modules by plain name
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
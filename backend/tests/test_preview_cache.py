@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+
+import main
+
+ELEMENTS = [{"content": "Ana Souza", "x": 944, "y": 887, "rotation": 90, "fontSize": 120}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(main, "_preview_cache", OrderedDict())
+    monkeypatch.setattr(main, "_preview_cache_bytes", 0)
+    monkeypatch.setattr(main, "_preview_inflight", {})
+
+
+def test_etag_matches():
+    etag = '"abc"'
+    assert main.etag_matches('"abc"', etag)
+    assert main.etag_matches('W/"abc"', etag)
+    assert main.etag_matches('"x", "abc"', etag)
+    assert not main.etag_matches('"x"', etag)
+    assert not main.etag_matches(None, etag)
+    assert not main.etag_matches("*", etag)
+
+
+def test_cache_key_ignores_key_order():
+    reordered = [{"fontSize": 120, "rotation": 90, "y": 887, "x": 944, "content": "Ana Souza"}]
+    assert main.preview_cache_key("Ana", ELEMENTS) == main.preview_cache_key("Ana", reordered)
+    assert main.preview_cache_key("Ana", ELEMENTS) != main.preview_cache_key("Bruno", ELEMENTS)
+
+
+def test_cache_key_includes_asset_fingerprint(monkeypatch):
+    key = main.preview_cache_key("Ana", ELEMENTS)
+    monkeypatch.setattr(main, "_asset_fingerprint", "other-template")
+    assert main.preview_cache_key("Ana", ELEMENTS) != key
+
+
+def test_expired_entries_are_dropped_on_insert(monkeypatch):
+    monkeypatch.setattr(main, "PREVIEW_CACHE_TTL", 0.05)
+    with main._preview_lock:
+        main._store_preview("old", "x" * 10)
+    time.sleep(0.1)
+    with main._preview_lock:
+        main._store_preview("new", "y" * 10)
+    assert list(main._preview_cache) == ["new"]
+    assert main._preview_cache_bytes == 10
+
+
+def test_byte_bound_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(main, "PREVIEW_CACHE_MAX_BYTES", 25)
+    with main._preview_lock:
+        for key in ("a", "b", "c"):
+            main._store_preview(key, "z" * 10)
+    assert list(main._preview_cache) == ["b", "c"]
+    assert main._preview_cache_bytes == 20
+
+
+def test_concurrent_identical_previews_render_once(monkeypatch):
+    calls = []
+
+    def fake_render(name, elements):
+        calls.append(name)
+        time.sleep(0.2)
+        return "image"
+
+    monkeypatch.setattr(main, "render_preview", fake_render)
+    key = main.preview_cache_key("Ana", ELEMENTS)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(main.get_preview_single_flight(key, "Ana", ELEMENTS)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["image"] * 8
+    assert len(calls) == 1
+    assert main._preview_inflight == {}
+
+
+def test_aborted_render_fails_followers_with_ordinary_error(monkeypatch):
+    started = threading.Event()
+
+    def aborted_render(name, elements):
+        started.set()
+        time.sleep(0.2)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "render_preview", aborted_render)
+    key = main.preview_cache_key("Ana", ELEMENTS)
+    follower_error = []
+
+    def follower():
+        started.wait()
+        try:
+            main.get_preview_single_flight(key, "Ana", ELEMENTS)
+        except Exception as e:
+            follower_error.append(e)
+
+    t = threading.Thread(target=follower)
+    t.start()
+    with pytest.raises(KeyboardInterrupt):
+        main.get_preview_single_flight(key, "Ana", ELEMENTS)
+    t.join(timeout=2)
+
+    assert isinstance(follower_error[0], RuntimeError)
+    assert main._preview_inflight == {}
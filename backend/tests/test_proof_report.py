@@ -0,0 +1,32 @@
+import main
+
+
+def overflow(element, content, text_w=2000):
+    return {"element": element, "content": content, "text_w": text_w, "text_h": 100,
+            "max_w": 1800, "max_h": 400, "fontSize": 120}
+
+
+def test_report_counts_names_not_elements():
+    names = ["Ana", "Pedro de Alcântara", "Ana", "Ana"]
+    badge_overflows = [
+        (0, [overflow(1, "Pedro de Alcântara"), overflow(3, "Pedro de Alcântara")]),
+        # Same name in both slots must stay two entries
+        (1, [overflow(0, "Ana"), overflow(2, "Ana"), overflow(1, "Ana"), overflow(3, "Ana")]),
+    ]
+    report = main.build_proof_report(names, badge_overflows)
+
+    assert report["overflow_count"] == 3
+    assert [(o["badge"], o["index"], o["name"]) for o in report["overflows"]] == [
+        (0, 1, "Pedro de Alcântara"), (1, 2, "Ana"), (1, 3, "Ana"),
+    ]
+    assert [box["element"] for box in report["overflows"][0]["elements"]] == [1, 3]
+
+
+def test_layout_element_reported_once():
+    names = ["Ana", "Bruno", "Carla", "Daniel"]
+    badge_overflows = [(0, [overflow(4, "New Text")]), (1, [overflow(4, "New Text")])]
+    report = main.build_proof_report(names, badge_overflows)
+
+    assert report["overflow_count"] == 0
+    assert len(report["layout_overflows"]) == 1
+    assert report["layout_overflows"][0]["content"] == "New Text"
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { Eye, Edit3, Save, Download, LayoutTemplate, Undo2, Redo2, Wifi, WifiOff, RefreshCcw, FileText, Sparkles } from 'lucide-react';
+import { Eye, Edit3, Save, Download, LayoutTemplate, Undo2, Redo2, Wifi, WifiOff, RefreshCcw, FileText, Sparkles, ScanSearch, X, AlertTriangle } from 'lucide-react';
 import { Toaster, toast } from 'sonner';
 
 import Canvas from './components/Canvas';
@@ -7,8 +7,7 @@ import Layout from './components/Layout';
 import InspectorPanel from './components/InspectorPanel';
 import LayersPanel from './components/LayersPanel';
 import { EditorProvider, useEditor } from './context/EditorContext';
-import { checkHealth, generateBatch } from './api';
-
+import { checkHealth, generateBatch, generateProofSheet, withFontSize } from './api';
 
 
 function AppContent() {
@@ -22,6 +21,8 @@ function AppContent() {
   const [isConnected, setIsConnected] = useState(false);
   const [nameList, setNameList] = useState(''); // Batch name input
   const [isGenerating, setIsGenerating] = useState(false); // Export loading state
+  const [isProofing, setIsProofing] = useState(false); // Proof sheet loading state
+  const [proof, setProof] = useState(null); // { pages, report } from /proof-sheet
 
   const handleReset = () => {
     if (confirm("Resetar layout para configurações padrão? Isso apagará suas edições salvas.")) {
@@ -124,10 +125,7 @@ function AppContent() {
 
       try {
         const blob = await Promise.race([
-          generateBatch(namesToExport, elements.map(el => ({
-            ...el,
-            fontSize: el.max_font_size || el.fontSize || 120
-          }))),
+          generateBatch(namesToExport, withFontSize(elements)),
           new Promise((_, reject) => {
             setTimeout(() => reject(new Error('Timeout')), 30000)
           })
@@ -177,6 +175,43 @@ function AppContent() {
     }
   };
 
+  const handleProof = async () => {
+    const names = nameList
+      .split('\n')
+      .map(n => n.trim())
+      .filter(n => n.length > 0);
+
+    if (names.length === 0) return;
+
+    setIsProofing(true);
+    const toastId = toast.loading("Gerando prova...", {
+      description: `${names.length} nome${names.length > 1 ? 's' : ''} em miniatura`
+    });
+
+    try {
+      const result = await generateProofSheet(names, elements);
+      setProof(result);
+
+      const overflowCount = result.report.overflow_count;
+      if (overflowCount > 0) {
+        toast.warning("Prova pronta", {
+          id: toastId,
+          description: `${overflowCount} nome${overflowCount > 1 ? 's' : ''} não cabe${overflowCount > 1 ? 'm' : ''} na caixa`
+        });
+      } else {
+        toast.success("Prova pronta", { id: toastId, description: "Todos os nomes cabem na caixa" });
+      }
+    } catch (e) {
+      console.error("Proof failed", e);
+      toast.error("Falha ao gerar prova", {
+        id: toastId,
+        description: e.response?.data?.detail || "Backend refused connection. Is the server running?"
+      });
+    } finally {
+      setIsProofing(false);
+    }
+  };
+
   return (
     <>
       <Toaster theme="dark" position="top-center" richColors toastOptions={{ style: { background: '#18181b', border: '1px solid #27272a', color: '#e4e4e7' } }} />
@@ -344,6 +379,17 @@ function AppContent() {
                     <Download size={18} className="md:w-5 md:h-5" />
                     {isConnected ? 'Gerar PDFs' : 'Backend Offline'}
                   </button>
+
+                  {/* Proof Sheet Button */}
+                  <button
+                    onClick={handleProof}
+                    disabled={!nameList.trim() || !isConnected || isProofing}
+                    className="w-full mt-3 bg-zinc-950 hover:bg-zinc-800 border border-zinc-800 disabled:text-zinc-600 disabled:cursor-not-allowed text-zinc-300 font-medium py-2.5 px-4 rounded-lg flex items-center justify-center gap-2 transition-all duration-200 text-sm"
+                    title="Miniaturas de todos os crachás para revisar antes de imprimir"
+                  >
+                    <ScanSearch size={16} />
+                    {isProofing ? 'Gerando prova...' : 'Revisar antes de imprimir'}
+                  </button>
                 </div>
 
                 {/* Help Text */}
@@ -368,6 +414,60 @@ function AppContent() {
           )}
         </div>
       </Layout>
+
+      {/* PROOF SHEET - contact sheets + overflow report */}
+      {proof && (
+        <div className="fixed inset-0 z-50 bg-black/80 flex items-center justify-center p-4 md:p-8">
+          <div className="bg-zinc-900 border border-zinc-800 rounded-xl shadow-2xl w-full max-w-6xl max-h-full flex flex-col">
+            <div className="flex items-center justify-between px-4 py-3 border-b border-zinc-800">
+              <div className="text-sm text-zinc-300">
+                <span className="font-bold text-zinc-100">Prova de impressão</span>
+                <span className="text-zinc-500 ml-3">
+                  {proof.report.total_names} nomes · {proof.report.total_badges} PDFs · {proof.pages.length} folha{proof.pages.length > 1 ? 's' : ''}
+                </span>
+              </div>
+              <button className="btn-icon" title="Fechar" onClick={() => setProof(null)}>
+                <X size={18} />
+              </button>
+            </div>
+
+            <div className="overflow-y-auto p-4 space-y-4">
+              {proof.report.overflow_count > 0 || proof.report.layout_overflows.length > 0 ? (
+                <div className="bg-red-500/5 border border-red-500/20 rounded-lg p-3">
+                  <div className="flex items-center gap-2 text-red-400 text-xs font-bold uppercase tracking-widest mb-2">
+                    <AlertTriangle size={14} /> {proof.report.overflow_count} fora da caixa
+                  </div>
+                  <ul className="text-xs text-zinc-300 space-y-1 font-mono">
+                    {proof.report.overflows.map((o) => (
+                      <li key={o.index}>
+                        #{o.badge + 1} — {o.name} ({o.elements.map(box => `${box.text_w}×${box.text_h}px`).join(', ')}; caixa {o.elements[0].max_w}×{o.elements[0].max_h}px, fonte {o.elements[0].fontSize})
+                      </li>
+                    ))}
+                    {proof.report.layout_overflows.map((box) => (
+                      <li key={`layout-${box.element}`}>
+                        Elemento fixo "{box.content}" ({box.text_w}×{box.text_h}px, caixa {box.max_w}×{box.max_h}px, fonte {box.fontSize}) — todos os crachás
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              ) : (
+                <div className="bg-green-500/5 border border-green-500/20 rounded-lg p-3 text-xs text-green-500">
+                  Todos os nomes cabem na caixa.
+                </div>
+              )}
+
+              {proof.pages.map((page, i) => (
+                <img
+                  key={i}
+                  src={`data:image/png;base64,${page}`}
+                  alt={`Folha de prova ${i + 1}`}
+                  className="w-full bg-white rounded"
+                />
+              ))}
+            </div>
+          </div>
+        </div>
+      )}
     </>
   );
 }
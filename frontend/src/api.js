@@ -11,6 +11,13 @@ const apiClient = axios.create({
     }
 });
 
+// The editor stores max_font_size; the backend renders with fontSize.
+// Used by both the PDF export and the proof sheet so they measure the same size.
+export const withFontSize = (elements) => elements.map(el => ({
+    ...el,
+    fontSize: el.max_font_size || el.fontSize || 120
+}));
+
 export const checkHealth = async () => {
     try {
         const res = await apiClient.get('/health');
@@ -28,3 +35,10 @@ export const generateBatch = async (names, elements) => {
     });
     return res.data;
 };
+
+export const generateProofSheet = async (names, elements, scale) => {
+    const res = await apiClient.post('/proof-sheet', { names, elements: withFontSize(elements), scale }, {
+        timeout: 120000
+    });
+    return res.data;
+};